@@ -4,73 +4,114 @@ Nemo extension to open folders in Miller Columns view
 Adds a context menu entry "Open in Miller Columns"
 """
 
+import logging
 import os
-import subprocess
-from urllib.parse import unquote
-from gi.repository import Nemo, GObject
+import shutil
+import sys
+from gi.repository import Nemo, GObject, GLib
+
+log = logging.getLogger(__name__)
+
+# Resolved once so launches skip the PATH walk. Inside Nemo sys.executable
+# may point at the host binary rather than an interpreter, so prefer python3.
+PYTHON = shutil.which('python3') or sys.executable
+
+# Scheme prefix of local URIs and its length
+_LOCAL_PREFIX = 'file://'
+_FILE_PREFIX_LEN = len(_LOCAL_PREFIX)
 
 
 class MillerColumnsExtension(GObject.GObject, Nemo.MenuProvider):
     """Extension that adds Miller Columns option to context menu"""
 
+    _LABEL = "Open in Miller Columns"
+    _TIP = "Open this folder in Miller Columns view"
+    _ICON = "view-column-symbolic"
+
     def __init__(self):
         super().__init__()
         # Path to the Miller Columns application
         self.app_path = os.path.expanduser("~/.local/share/nemo-miller-columns/nemo_miller_columns.py")
+        self._app_available = os.path.isfile(self.app_path)
+        self._base_argv = (PYTHON, self.app_path)
 
     def _open_miller_columns(self, menu, folder_path):
         """Opens the folder in Miller Columns"""
+        if not self._app_available:
+            # Re-check in case the application was installed after Nemo started
+            self._app_available = os.path.isfile(self.app_path)
+            if not self._app_available:
+                log.warning("Miller Columns application not found: %s", self.app_path)
+                return
+
         try:
-            subprocess.Popen(['python3', self.app_path, folder_path])
-        except Exception as e:
-            print(f"Error opening Miller Columns: {e}")
+            # GLib spawns without subprocess' close_fds walk and lets the
+            # Nemo main loop reap the child
+            pid, _, _, _ = GLib.spawn_async(
+                [*self._base_argv, folder_path],
+                flags=GLib.SpawnFlags.DO_NOT_REAP_CHILD
+            )
+            GLib.child_watch_add(GLib.PRIORITY_DEFAULT, pid, self._on_child_exit)
+        except Exception:
+            log.exception("Error opening Miller Columns")
+
+    def _on_child_exit(self, pid, status):
+        """Releases the launched process once it exits"""
+        GLib.spawn_close_pid(pid)
 
     def _get_file_path(self, file_info):
         """Extracts the file path from a NemoFileInfo"""
         uri = file_info.get_uri()
-        if uri.startswith('file://'):
-            return unquote(uri[7:])
-        return None
+        # Slice comparison skips the startswith method dispatch
+        if uri[:_FILE_PREFIX_LEN] == _LOCAL_PREFIX:
+            path = uri[_FILE_PREFIX_LEN:]
+        elif uri[:5] == 'file:':
+            # Short "file:/path" form without the authority slashes
+            path = uri[5:]
+        else:
+            # Remote locations (smb://, sftp://, ...) have no local path
+            return None
+        # Most local URIs carry no escapes, so skip the unquote pipeline
+        if '%' not in path:
+            return path
+        # Imported lazily to keep urllib out of Nemo's startup
+        from urllib.parse import unquote
+        return unquote(path)
+
+    def _build_menu_item(self, path, name):
+        """Creates the "Open in Miller Columns" menu item for a folder"""
+        item = Nemo.MenuItem(
+            name=f"MillerColumnsExtension::{name}",
+            label=self._LABEL,
+            tip=self._TIP,
+            icon=self._ICON
+        )
+        # Bind the path in the closure instead of passing it as signal user data
+        item.connect('activate', lambda menu, p=path: self._open_miller_columns(menu, p))
+        return item
 
     def get_file_items(self, window, files):
         """Context menu for selected files/folders"""
-        if len(files) != 1:
-            return []
+        # Only for a single selection: files[1:2] is non-empty for 2+ items
+        if not files or files[1:2]:
+            return ()
 
         file_info = files[0]
 
         # Only for directories
         if not file_info.is_directory():
-            return []
+            return ()
 
         path = self._get_file_path(file_info)
         if not path:
-            return []
-
-        # Create menu item
-        item = Nemo.MenuItem(
-            name="MillerColumnsExtension::OpenMillerColumns",
-            label="Open in Miller Columns",
-            tip="Open this folder in Miller Columns view",
-            icon="view-column-symbolic"
-        )
-        item.connect('activate', self._open_miller_columns, path)
+            return ()
 
-        return [item]
+        return (self._build_menu_item(path, "OpenMillerColumns"),)
 
     def get_background_items(self, window, folder):
         """Context menu for folder background (click on empty area)"""
         path = self._get_file_path(folder)
         if not path:
-            return []
-
-        # Create menu item
-        item = Nemo.MenuItem(
-            name="MillerColumnsExtension::OpenMillerColumnsBackground",
-            label="Open in Miller Columns",
-            tip="Open this folder in Miller Columns view",
-            icon="view-column-symbolic"
-        )
-        item.connect('activate', self._open_miller_columns, path)
+            return ()
 
-        return [item]
+        return (self._build_menu_item(path, "OpenMillerColumnsBackground"),)
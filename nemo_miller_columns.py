@@ -6,11 +6,21 @@ Inspired by macOS Finder
 
 import sys
 import os
+import re
+import shutil
+import stat
 import gi
-import subprocess
+import bisect
+import functools
+import itertools
+import operator
 import mimetypes
 import urllib.parse
 import threading
+import queue
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from dataclasses import dataclass
 from typing import Generator, Optional
@@ -22,165 +32,679 @@ gi.require_version('Pango', '1.0')
 from gi.repository import Gtk, Gdk, GdkPixbuf, Gio, GLib, Pango
 
 
-class FileItem:
-    """Represents a file or directory"""
+# Default icon theme, shared by every view
+_ICON_THEME = None
 
-    def __init__(self, path):
-        self.path = Path(path)
-        self.name = self.path.name or str(self.path)
-        self.is_dir = self.path.is_dir()
-        self.is_symlink = self.path.is_symlink()
+# Lowercase file suffix -> theme icon name, built on first use
+_SUFFIX_TO_ICON = None
 
-    def get_icon(self, icon_theme, size=24):
-        """Gets the appropriate icon for the file"""
-        try:
-            if self.is_dir:
-                icon_name = "folder"
-            else:
-                mime_type, _ = mimetypes.guess_type(str(self.path))
-                if mime_type:
-                    # Convert MIME type to icon name
-                    icon_name = mime_type.replace('/', '-')
+
+def _get_icon_theme():
+    """Returns the shared icon theme, watching it for changes on first use"""
+    global _ICON_THEME
+    if _ICON_THEME is None:
+        _ICON_THEME = Gtk.IconTheme.get_default()
+        _ICON_THEME.connect("changed", _on_icon_theme_changed)
+    return _ICON_THEME
+
+
+def _suffix_icon_map():
+    """Returns the suffix to icon name map, resolving it against the theme once"""
+    global _SUFFIX_TO_ICON
+    if _SUFFIX_TO_ICON is None:
+        if not mimetypes.inited:
+            mimetypes.init()
+        icon_theme = _get_icon_theme()
+        icon_by_mime = {}
+        suffix_map = {}
+        for suffix, mime_type in mimetypes.types_map.items():
+            icon_name = icon_by_mime.get(mime_type)
+            if icon_name is None:
+                # Convert MIME type to icon name
+                icon_name = mime_type.replace('/', '-')
+                if not icon_theme.has_icon(icon_name):
+                    # Try with generic category
+                    icon_name = mime_type.split('/')[0] + "-x-generic"
                     if not icon_theme.has_icon(icon_name):
-                        # Try with generic category
-                        icon_name = mime_type.split('/')[0] + "-x-generic"
-                        if not icon_theme.has_icon(icon_name):
-                            icon_name = "text-x-generic"
-                else:
-                    icon_name = "text-x-generic"
+                        icon_name = "text-x-generic"
+                icon_by_mime[mime_type] = icon_name
+            suffix_map.setdefault(suffix.lower(), icon_name)
+        _SUFFIX_TO_ICON = suffix_map
+    return _SUFFIX_TO_ICON
+
+
+@functools.lru_cache(maxsize=256)
+def _load_icon_cached(icon_name, size):
+    """Loads a themed icon pixbuf, shared by every row using the same icon"""
+    icon_theme = _get_icon_theme()
+    flags = Gtk.IconLookupFlags.FORCE_SIZE | Gtk.IconLookupFlags.USE_BUILTIN
+    # load_icon raises for missing icons, so no has_icon probe is needed
+    try:
+        return icon_theme.load_icon(icon_name, size, flags)
+    except GLib.Error:
+        # Fallback to generic icon
+        try:
+            return icon_theme.load_icon("text-x-generic", size, flags)
+        except GLib.Error:
+            return None
 
-            if icon_theme.has_icon(icon_name):
-                return icon_theme.load_icon(icon_name, size, Gtk.IconLookupFlags.FORCE_SIZE)
-            else:
-                return icon_theme.load_icon("text-x-generic", size, Gtk.IconLookupFlags.FORCE_SIZE)
-        except Exception:
-            # Fallback to generic icon
-            try:
-                return icon_theme.load_icon("text-x-generic", size, Gtk.IconLookupFlags.FORCE_SIZE)
-            except Exception:
-                return None
+
+@functools.lru_cache(maxsize=4096)
+def _guess_mime_by_ext(ext: str) -> Optional[str]:
+    """Guesses the MIME type for a lowercase file suffix"""
+    return mimetypes.guess_type("x" + ext)[0]
+
+
+def _icon_name_for(name, is_dir):
+    """Gets the theme icon name for a file name"""
+    if is_dir:
+        return "folder"
+    suffix = os.path.splitext(name)[1].lower()
+    return _suffix_icon_map().get(suffix, "text-x-generic")
+
+
+# Terminal emulators tried by "Open Terminal here", in order of preference
+_TERMINALS = ('gnome-terminal', 'xfce4-terminal', 'konsole', 'xterm')
+
+
+@functools.lru_cache(maxsize=None)
+def _find_program(name):
+    """Returns the absolute path of a program on PATH, looked up once"""
+    return shutil.which(name)
+
+
+@functools.lru_cache(maxsize=None)
+def _find_terminal():
+    """Returns the path of the first installed terminal emulator, or None"""
+    for term in _TERMINALS:
+        path = _find_program(term)
+        if path:
+            return path
+    return None
+
+
+def _spawn(argv):
+    """Starts a program without waiting for it. GLib spawns without
+    subprocess' fork setup and lets the main loop reap the child."""
+    pid, _, _, _ = GLib.spawn_async(argv, flags=GLib.SpawnFlags.DO_NOT_REAP_CHILD)
+    GLib.child_watch_add(GLib.PRIORITY_DEFAULT, pid, _on_child_exit)
+
+
+def _on_child_exit(pid, status):
+    """Releases a spawned process once it exits"""
+    GLib.spawn_close_pid(pid)
+
+
+# Worker threads for blocking filesystem work (directory scans)
+_IO_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="miller-io")
+
+# Directory -> (st_mtime_ns, sorted FileItem list), least recent first. A
+# listing is only reused while the directory's mtime is unchanged.
+# Filled from _IO_POOL workers, so every access holds _LISTING_LOCK.
+_LISTING_CACHE = OrderedDict()
+_LISTING_CACHE_SIZE = 64
+_LISTING_LOCK = threading.Lock()
+
+
+# Application stylesheet, parsed once for every window
+_CSS_BYTES = b"""
+.miller-columns-container {
+    background-color: @theme_base_color;
+}
+
+.miller-column {
+    background-color: @theme_base_color;
+}
+
+.miller-column:selected {
+    background-color: @theme_selected_bg_color;
+    color: @theme_selected_fg_color;
+}
+
+.preview-frame {
+    background-color: @theme_base_color;
+}
+
+.preview-title {
+    font-size: 14px;
+    font-weight: bold;
+}
+
+.path-bar {
+    padding: 4px 8px;
+    background-color: @theme_bg_color;
+}
+
+.path-button {
+    padding: 2px 6px;
+    min-height: 24px;
+}
+
+.resize-handle {
+    background-color: @borders;
+    min-width: 6px;
+}
+
+.resize-handle:hover {
+    background-color: @theme_selected_bg_color;
+}
+
+.search-results {
+    background-color: @theme_base_color;
+}
+
+.search-results:selected {
+    background-color: @theme_selected_bg_color;
+    color: @theme_selected_fg_color;
+}
+"""
+
+_CSS_PROVIDER = Gtk.CssProvider()
+_CSS_PROVIDER.load_from_data(_CSS_BYTES)
+
+# Whether _CSS_PROVIDER has been added to the default screen
+_css_installed = False
+
+
+# Sort key of FileItems: directories first, then case-insensitive name
+_SORT_KEY = operator.attrgetter("_sort_key")
+
+
+def _prefetch_stats(items):
+    """Fills the stat cache of FileItems ahead of selection. Runs on _IO_POOL."""
+    for item in items:
+        try:
+            item.stat()
+        except OSError:
+            pass
+
+
+def _invalidate_listing(path):
+    """Drops the cached listing of a directory"""
+    with _LISTING_LOCK:
+        _LISTING_CACHE.pop(str(path), None)
+
+
+def _on_icon_theme_changed(icon_theme):
+    """Drops cached icons when the icon theme changes"""
+    global _SUFFIX_TO_ICON
+    _SUFFIX_TO_ICON = None
+    _load_icon_cached.cache_clear()
+
+
+class FileItem:
+    """Represents a file or directory"""
+
+    # One FileItem per directory entry: slots keep them small and make
+    # attribute access in the scan/sort/row paths cheaper
+    __slots__ = ('path_str', 'name', 'is_dir', '_is_symlink', '_path', '_stat', '_sort_key')
+
+    def __init__(self, path_str, name, is_dir, is_symlink=None):
+        self.path_str = path_str
+        self._path = None
+        self.name = name
+        # is_dir is needed right away for sorting, is_symlink only on demand
+        self.is_dir = is_dir
+        self._is_symlink = is_symlink
+        self._stat = None
+        # Directories first, then case-insensitive name. A plain str rather
+        # than a tuple lets list.sort use its str-only comparison fast path.
+        self._sort_key = ("0" if is_dir else "1") + name.casefold()
+
+    @classmethod
+    def from_entry(cls, entry):
+        """Builds the item from an os.DirEntry, reusing its cached type info"""
+        # Follows symlinks so linked folders stay navigable; only symlinks
+        # cost an extra stat, other entries are answered from readdir
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            # e.g. a symlink loop, listed as a file like Path.is_dir() did
+            is_dir = False
+        return cls(entry.path, entry.name, is_dir)
+
+    @classmethod
+    def from_path(cls, path_str):
+        """Builds the item for a single path, e.g. one reported by a file monitor"""
+        return cls(path_str, os.path.basename(path_str), os.path.isdir(path_str))
+
+    @property
+    def is_symlink(self):
+        """Whether the item is a symlink, looked up once on first use"""
+        if self._is_symlink is None:
+            self._is_symlink = os.path.islink(self.path_str)
+        return self._is_symlink
+
+    @property
+    def path(self):
+        """The item's Path, only built once something asks for it"""
+        if self._path is None:
+            self._path = Path(self.path_str)
+        return self._path
+
+    def stat(self):
+        """Returns the item's stat result, fetched once on first use"""
+        if self._stat is None:
+            self._stat = os.stat(self.path_str)
+        return self._stat
+
+    def get_icon_name(self):
+        """Gets the theme icon name for the file"""
+        return _icon_name_for(self.name, self.is_dir)
+
+    def get_icon(self, size=24):
+        """Gets the appropriate icon for the file"""
+        return _load_icon_cached(self.get_icon_name(), size)
 
 
 class ColumnView(Gtk.Box):
     """A single column in the Miller view"""
 
     MIN_WIDTH = 100
+    CHUNK_SIZE = 200  # Rows added per main loop iteration
+    PREFETCH_MARGIN = 20  # Rows around the viewport whose stat is prefetched
+
+    # Store columns
+    COL_ICON = 0
+    COL_NAME = 1
+    COL_ITEM = 2
+    COL_IS_DIR = 3
 
     def __init__(self, path, on_item_selected, on_item_activated):
         super().__init__(orientation=Gtk.Orientation.VERTICAL)
         self.path = Path(path)
         self.on_item_selected = on_item_selected
         self.on_item_activated = on_item_activated
-        self.icon_theme = Gtk.IconTheme.get_default()
+
+        # Directory scan running on _IO_POOL, and a selection waiting for it
+        self._scan_future = None
+        self._pending_select = None
+
+        # Sorted items of the directory, a private copy of the cached listing.
+        # Row i of the store shows _items[i].
+        self._items = None
+        # Sort keys of _items, kept in step for bisect (no key= before 3.10)
+        self._keys = None
+
+        # Rows not yet added by the chunked populate
+        self._pending_items = None
+        self._pending_pos = 0
+        self._idle_id = 0
+        self._prefetch_id = 0
+        self._placeholder = None  # Message shown instead of the list
+
+        # Drop the cached listing when the directory changes on disk
+        try:
+            self._monitor = Gio.File.new_for_path(str(self.path)).monitor_directory(
+                Gio.FileMonitorFlags.NONE, None
+            )
+            self._monitor.connect("changed", self._on_directory_changed)
+        except GLib.Error:
+            self._monitor = None
+        self.connect("destroy", self._on_destroy)
 
         # Set minimum width
         self.set_size_request(self.MIN_WIDTH, -1)
 
         # ScrolledWindow for the list
-        scroll = Gtk.ScrolledWindow()
-        scroll.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
-        scroll.set_vexpand(True)
-        scroll.set_hexpand(True)
+        self._scroll = Gtk.ScrolledWindow()
+        self._scroll.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
+        self._scroll.set_vexpand(True)
+        self._scroll.set_hexpand(True)
+        self._vadjustment = self._scroll.get_vadjustment()
+        self._vadjustment.connect("value-changed", self._on_scrolled)
+
+        # TreeView for items: rows are drawn by shared cell renderers,
+        # so only the visible ones cost anything
+        self.store = Gtk.ListStore(str, str, object, bool)
+        self.treeview = Gtk.TreeView(model=self.store)
+        self.treeview.set_headers_visible(False)
+        self.treeview.set_search_column(self.COL_NAME)
+        self.treeview.connect("row-activated", self._on_row_activated)
+        self.treeview.get_style_context().add_class("miller-column")
+
+        # Icon, by theme name: GTK only loads it when the row is drawn
+        column = Gtk.TreeViewColumn()
+        icon_renderer = Gtk.CellRendererPixbuf(stock_size=Gtk.IconSize.LARGE_TOOLBAR,
+                                               xpad=4, ypad=4)
+        column.pack_start(icon_renderer, False)
+        column.add_attribute(icon_renderer, "icon-name", self.COL_ICON)
 
-        # ListBox for items
-        self.listbox = Gtk.ListBox()
-        self.listbox.set_selection_mode(Gtk.SelectionMode.SINGLE)
-        self.listbox.connect("row-selected", self._on_row_selected)
-        self.listbox.connect("row-activated", self._on_row_activated)
-        self.listbox.get_style_context().add_class("miller-column")
+        # File name
+        name_renderer = Gtk.CellRendererText(ellipsize=Pango.EllipsizeMode.END)
+        column.pack_start(name_renderer, True)
+        column.add_attribute(name_renderer, "text", self.COL_NAME)
 
-        scroll.add(self.listbox)
-        self.pack_start(scroll, True, True, 0)
+        # Arrow for directories
+        arrow_renderer = Gtk.CellRendererPixbuf(icon_name="go-next-symbolic",
+                                                sensitive=False, xpad=4)
+        column.pack_end(arrow_renderer, False)
+        column.add_attribute(arrow_renderer, "visible", self.COL_IS_DIR)
+        self.treeview.append_column(column)
+
+        self._selection = self.treeview.get_selection()
+        self._selection.set_mode(Gtk.SelectionMode.SINGLE)
+        self._selection_changed_id = self._selection.connect("changed", self._on_selection_changed)
+
+        self._scroll.add(self.treeview)
+        self.pack_start(self._scroll, True, True, 0)
 
         self.populate()
 
     def populate(self):
         """Populates the column with directory contents"""
-        for child in self.listbox.get_children():
-            self.listbox.remove(child)
+        self.cancel_populate()
+        self.store.clear()
+        self._items = None
+        self._keys = None
+        self._set_placeholder(None)
+
+        # Scan in the background and apply the result on the main loop
+        future = _IO_POOL.submit(self._scan_sync)
+        self._scan_future = future
+        future.add_done_callback(lambda f: GLib.idle_add(self._apply_scan, f))
+
+    def _apply_scan(self, future):
+        """Shows the result of a background scan unless it's been superseded"""
+        if future is not self._scan_future:
+            return False
+        self._scan_future = None
 
         try:
-            items = []
-            for entry in self.path.iterdir():
-                try:
-                    # Skip hidden files
-                    if not entry.name.startswith('.'):
-                        items.append(FileItem(entry))
-                except PermissionError:
-                    continue
-
-            # Sort: directories first, then files, alphabetically
-            items.sort(key=lambda x: (not x.is_dir, x.name.lower()))
-
-            for item in items:
-                row = self._create_row(item)
-                self.listbox.add(row)
-
+            items = future.result()
         except PermissionError:
+            # Nothing left to select in an unreadable directory
+            self._pending_select = None
             label = Gtk.Label(label="Permission denied")
             label.set_margin_top(20)
             label.set_margin_bottom(20)
-            self.listbox.add(label)
+            self._set_placeholder(label)
+            return False
         except Exception as e:
+            self._pending_select = None
             label = Gtk.Label(label=f"Error: {str(e)}")
             label.set_margin_top(20)
-            self.listbox.add(label)
-
-        self.listbox.show_all()
+            self._set_placeholder(label)
+            return False
 
-    def _create_row(self, item):
-        """Creates a row for an item"""
-        row = Gtk.ListBoxRow()
-        row.item = item
+        # Copied so file monitor updates don't touch the shared cached list
+        self._items = list(items)
+        self._keys = [item._sort_key for item in self._items]
+
+        # Add the first chunk now and stream the rest from idle callbacks,
+        # so large directories don't block the main loop
+        self._pending_items = self._items
+        self._pending_pos = 0
+        if self._add_next_chunk():
+            self._idle_id = GLib.idle_add(self._on_populate_idle)
+
+        if self._pending_select is not None:
+            path, self._pending_select = self._pending_select, None
+            self.select_path(path)
+        self._schedule_prefetch()
+        return False
 
-        hbox = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-        hbox.set_margin_start(8)
-        hbox.set_margin_end(8)
-        hbox.set_margin_top(4)
-        hbox.set_margin_bottom(4)
+    def _on_scrolled(self, adjustment):
+        """Prefetches metadata for the rows scrolled into view"""
+        self._schedule_prefetch()
+
+    def _schedule_prefetch(self):
+        """Queues a stat prefetch of the visible rows, coalescing requests"""
+        if not self._prefetch_id:
+            self._prefetch_id = GLib.idle_add(self._prefetch_visible)
+
+    def _prefetch_visible(self):
+        """Stats the items around the viewport on _IO_POOL, so the preview
+        panel finds their size and mtime already cached"""
+        self._prefetch_id = 0
+        count = len(self.store)
+        if not count:
+            return False
 
-        # Icon
-        icon = item.get_icon(self.icon_theme, 24)
-        if icon:
-            image = Gtk.Image.new_from_pixbuf(icon)
+        visible = self.treeview.get_visible_range()
+        if visible:
+            first = visible[0].get_indices()[0]
+            last = visible[1].get_indices()[0]
         else:
-            image = Gtk.Image.new_from_icon_name("text-x-generic", Gtk.IconSize.LARGE_TOOLBAR)
-        hbox.pack_start(image, False, False, 0)
+            # Not laid out yet, guess from the top
+            first, last = 0, 0
+
+        items = [item for item in self._items[max(0, first - self.PREFETCH_MARGIN):
+                                              min(count, last + self.PREFETCH_MARGIN + 1)]
+                 if item._stat is None]
+        if items:
+            _IO_POOL.submit(_prefetch_stats, items)
+        return False
 
-        # File name
-        label = Gtk.Label(label=item.name)
-        label.set_xalign(0)
-        label.set_ellipsize(Pango.EllipsizeMode.END)
-        label.set_hexpand(True)
-        hbox.pack_start(label, True, True, 0)
+    def _scan_sync(self):
+        """Returns the sorted items of this column, reusing cached listings.
+        Runs on _IO_POOL."""
+        path = str(self.path)
+        mtime = os.stat(path).st_mtime_ns
+        with _LISTING_LOCK:
+            cached = _LISTING_CACHE.get(path)
+            if cached is not None and cached[0] == mtime:
+                _LISTING_CACHE.move_to_end(path)
+                items = cached[1]
+                # Editing a file in place leaves the directory mtime alone,
+                # so stat again lazily on a revisit
+                for item in items:
+                    item._stat = None
+                return items
+
+        # DirEntry answers is_dir from the readdir d_type, no stat per child
+        items = []
+        append = items.append
+        from_entry = FileItem.from_entry
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    # Skip hidden files
+                    if entry.name[:1] != '.':
+                        append(from_entry(entry))
+                except PermissionError:
+                    continue
 
-        # Arrow for directories
-        if item.is_dir:
-            arrow = Gtk.Image.new_from_icon_name("go-next-symbolic", Gtk.IconSize.MENU)
-            arrow.set_opacity(0.5)
-            hbox.pack_end(arrow, False, False, 0)
+        # Sort: directories first, then files, alphabetically
+        items.sort(key=_SORT_KEY)
+
+        with _LISTING_LOCK:
+            # Replaces any listing from an older mtime
+            _LISTING_CACHE[path] = (mtime, items)
+            _LISTING_CACHE.move_to_end(path)
+            if len(_LISTING_CACHE) > _LISTING_CACHE_SIZE:
+                _LISTING_CACHE.popitem(last=False)
+        return items
 
-        row.add(hbox)
-        return row
+    def _on_directory_changed(self, monitor, file, other_file, event_type):
+        """Invalidates the cached listing and applies the change to the rows"""
+        _invalidate_listing(self.path)
 
-    def _on_row_selected(self, listbox, row):
+        path = file.get_path()
+        if path is None or file.get_basename()[:1] == '.':
+            return
+
+        if self._scan_future is not None:
+            # Only additions and removals change the listing; other events
+            # just needed the cache dropped above
+            if event_type not in (Gio.FileMonitorEvent.CREATED,
+                                  Gio.FileMonitorEvent.DELETED):
+                return
+            # The running scan may have missed this change, start over
+            pending_select = self._pending_select
+            self.populate()
+            self._pending_select = pending_select
+            return
+        if self._items is None:
+            return
+
+        if event_type == Gio.FileMonitorEvent.CREATED:
+            self._insert_item(path)
+        elif event_type == Gio.FileMonitorEvent.DELETED:
+            self._remove_item(path)
+        elif event_type in (Gio.FileMonitorEvent.CHANGED,
+                            Gio.FileMonitorEvent.CHANGES_DONE_HINT,
+                            Gio.FileMonitorEvent.ATTRIBUTE_CHANGED):
+            index = self._find_item(path)
+            if index is not None:
+                self._items[index]._stat = None
+
+    def _find_item(self, path):
+        """Returns the index of the item with the given path, or None"""
+        items = self._items
+        keys = self._keys
+        name = os.path.basename(path).casefold()
+        # Binary search on the sort key, trying both directory and file
+        for key in ("0" + name, "1" + name):
+            index = bisect.bisect_left(keys, key)
+            while index < len(keys) and keys[index] == key:
+                if items[index].path_str == path:
+                    return index
+                index += 1
+        return None
+
+    def _is_in_store(self, index):
+        """Whether the item at index already has a row"""
+        return self._pending_items is None or index < self._pending_pos
+
+    def _insert_item(self, path):
+        """Adds a newly created entry at its sorted position"""
+        item = FileItem.from_path(path)
+        index = self._find_item(path)
+        if index is not None:
+            # Replaced, e.g. renamed over by an atomic save
+            if self._items[index].is_dir == item.is_dir:
+                self._items[index] = item
+                if self._is_in_store(index):
+                    self.store[index][self.COL_ITEM] = item
+                return
+            # Changed type, so it moves to the other group
+            self._remove_item(path)
+        index = bisect.bisect_right(self._keys, item._sort_key)
+        self._items.insert(index, item)
+        self._keys.insert(index, item._sort_key)
+        # Items past the rows added so far are picked up by later chunks
+        if self._is_in_store(index):
+            if self._pending_items is not None:
+                self._pending_pos += 1
+            self.store.insert(index, self._row_values(item))
+
+    def _remove_item(self, path):
+        """Removes the row of a deleted entry"""
+        index = self._find_item(path)
+        if index is None:
+            return
+        del self._items[index]
+        del self._keys[index]
+        if self._is_in_store(index):
+            if self._pending_items is not None:
+                self._pending_pos -= 1
+            self.store.remove(self.store.iter_nth_child(None, index))
+
+    def _on_destroy(self, widget):
+        """Stops scanning and monitoring the directory once the column is gone"""
+        self.cancel_populate()
+        if self._monitor:
+            self._monitor.cancel()
+            self._monitor = None
+
+    def _set_placeholder(self, label):
+        """Shows a message in place of the item list, or the list again for None"""
+        if self._placeholder is not None:
+            self._placeholder.destroy()
+        self._placeholder = label
+        if label is None:
+            self._scroll.show()
+            return
+        self._scroll.hide()
+        self.pack_start(label, False, False, 0)
+        label.show()
+
+    def _row_values(self, item):
+        """Returns the store row for an item"""
+        return (item.get_icon_name(), item.name, item, item.is_dir)
+
+    def _add_next_chunk(self):
+        """Adds the next batch of rows. Returns True while more rows are due."""
+        items = self._pending_items
+        start = self._pending_pos
+        end = min(start + self.CHUNK_SIZE, len(items))
+        append = self.store.append
+        row_values = self._row_values
+        # Filling an empty store, there's no selection or scroll position to
+        # lose, so detach it and let the view pick up the batch in one go
+        detach = start == 0
+        if detach:
+            self.treeview.set_model(None)
+        try:
+            for item in items[start:end]:
+                append(row_values(item))
+        finally:
+            if detach:
+                self.treeview.set_model(self.store)
+
+        self._pending_pos = end
+        if end == len(items):
+            self._pending_items = None
+            return False
+        return True
+
+    def _on_populate_idle(self):
+        """Idle callback that adds the remaining rows chunk by chunk"""
+        if self._add_next_chunk():
+            return True
+        self._idle_id = 0
+        return False
+
+    def cancel_populate(self):
+        """Stops a pending scan and any rows left over from a chunked populate"""
+        if self._scan_future is not None:
+            self._scan_future.cancel()
+            self._scan_future = None
+        self._pending_select = None
+        if self._prefetch_id:
+            GLib.source_remove(self._prefetch_id)
+            self._prefetch_id = 0
+        if self._idle_id:
+            GLib.source_remove(self._idle_id)
+            self._idle_id = 0
+        self._pending_items = None
+
+    def _on_selection_changed(self, selection):
         """Handles row selection"""
-        if row and hasattr(row, 'item'):
-            self.on_item_selected(self, row.item)
+        model, tree_iter = selection.get_selected()
+        if tree_iter is not None:
+            self.on_item_selected(self, model[tree_iter][self.COL_ITEM])
 
-    def _on_row_activated(self, listbox, row):
+    def _on_row_activated(self, treeview, tree_path, column):
         """Handles row activation (double-click)"""
-        if row and hasattr(row, 'item'):
-            self.on_item_activated(row.item)
+        self.on_item_activated(self.store[tree_path][self.COL_ITEM])
 
     def select_path(self, path):
-        """Selects an item by its path"""
-        path = Path(path)
-        for row in self.listbox.get_children():
-            if hasattr(row, 'item') and row.item.path == path:
-                self.listbox.select_row(row)
-                return True
-        return False
+        """Selects an item by its path, once the listing has been loaded.
+        Doesn't report the selection to on_item_selected."""
+        if self._scan_future is not None:
+            self._pending_select = path
+            return True
+        if self._items is None:
+            return False
+
+        index = self._find_item(str(path))
+        if index is None:
+            return False
+        # The row may still be waiting in a pending chunk
+        while not self._is_in_store(index):
+            if not self._add_next_chunk():
+                self.cancel_populate()
+
+        tree_path = Gtk.TreePath.new_from_indices([index])
+        self._selection.handler_block(self._selection_changed_id)
+        try:
+            self._selection.select_path(tree_path)
+        finally:
+            self._selection.handler_unblock(self._selection_changed_id)
+        self.treeview.scroll_to_cell(tree_path, None, False, 0, 0)
+        return True
 
 
 class ResizeHandle(Gtk.EventBox):
@@ -250,6 +774,8 @@ class ResizeHandle(Gtk.EventBox):
 class PreviewPanel(Gtk.Box):
     """Preview panel for the selected file"""
 
+    PREVIEW_CACHE_SIZE = 16  # Scaled image previews kept for re-selection
+
     def __init__(self):
         super().__init__(orientation=Gtk.Orientation.VERTICAL, spacing=12)
         self.set_margin_start(20)
@@ -258,8 +784,6 @@ class PreviewPanel(Gtk.Box):
         self.set_margin_bottom(20)
         self.set_size_request(280, -1)
 
-        self.icon_theme = Gtk.IconTheme.get_default()
-
         # Large icon
         self.icon_image = Gtk.Image()
         self.pack_start(self.icon_image, False, False, 0)
@@ -289,6 +813,13 @@ class PreviewPanel(Gtk.Box):
         self.preview_scroll.add(self.preview_image)
         self.pack_start(self.preview_scroll, True, True, 0)
 
+        # Bumped on every update so stale background decodes are dropped
+        self._preview_token = 0
+        # (path, mtime_ns) -> scaled pixbuf, least recently shown first
+        self._preview_cache = OrderedDict()
+        # Same scheme for the background folder item count
+        self._count_token = 0
+
         self.show_all()
         self.preview_scroll.hide()
 
@@ -298,11 +829,12 @@ class PreviewPanel(Gtk.Box):
             self.clear()
             return
 
-        icon = item.get_icon(self.icon_theme, 64)
+        icon = item.get_icon(64)
         if icon:
             self.icon_image.set_from_pixbuf(icon)
 
-        self.name_label.set_markup(f"<b>{GLib.markup_escape_text(item.name)}</b>")
+        # Bold comes from the preview-title style, no markup to parse
+        self.name_label.set_text(item.name)
 
         # Clear previous info
         for child in self.info_grid.get_children():
@@ -314,29 +846,30 @@ class PreviewPanel(Gtk.Box):
         if item.is_dir:
             file_type = "Folder"
         else:
-            mime_type, _ = mimetypes.guess_type(str(item.path))
+            mime_type = _guess_mime_by_ext(os.path.splitext(item.name)[1].lower())
             file_type = mime_type or "File"
         self._add_info_row("Type:", file_type, row)
         row += 1
 
         # Size
-        try:
-            if item.is_dir:
-                count = sum(1 for _ in item.path.iterdir())
-                size_str = f"{count} items"
-            else:
-                size = item.path.stat().st_size
-                size_str = self._format_size(size)
-            self._add_info_row("Size:", size_str, row)
+        self._count_token += 1
+        if item.is_dir:
+            # Counted in the background, large folders take a while to list
+            value = self._add_info_row("Size:", "…", row)
+            _IO_POOL.submit(self._count_items, self._count_token, item.path, value, row)
             row += 1
-        except (PermissionError, OSError):
-            pass
+        else:
+            try:
+                size = item.stat().st_size
+                self._add_info_row("Size:", self._format_size(size), row)
+                row += 1
+            except (PermissionError, OSError):
+                pass
 
         # Modified date
         try:
-            mtime = item.path.stat().st_mtime
-            from datetime import datetime
-            mtime_str = datetime.fromtimestamp(mtime).strftime("%Y-%m-%d %H:%M")
+            mtime = item.stat().st_mtime
+            mtime_str = time.strftime("%Y-%m-%d %H:%M", time.localtime(mtime))
             self._add_info_row("Modified:", mtime_str, row)
             row += 1
         except (PermissionError, OSError):
@@ -363,6 +896,27 @@ class PreviewPanel(Gtk.Box):
         value.set_max_width_chars(20)
         value.set_selectable(True)
         self.info_grid.attach(value, 1, row, 1, 1)
+        return value
+
+    def _count_items(self, token, path, value, row):
+        """Counts folder entries. Runs on _IO_POOL."""
+        if token != self._count_token:
+            return
+        try:
+            count = len(os.listdir(path))
+        except (PermissionError, OSError):
+            count = None
+        GLib.idle_add(self._apply_count, token, count, value, row)
+
+    def _apply_count(self, token, count, value, row):
+        """Shows a folder item count unless the selection has changed since"""
+        if token != self._count_token:
+            return False
+        if count is None:
+            self.info_grid.remove_row(row)
+        else:
+            value.set_text(f"{count} items")
+        return False
 
     def _format_size(self, size):
         """Formats size in human-readable format"""
@@ -374,25 +928,64 @@ class PreviewPanel(Gtk.Box):
 
     def _update_image_preview(self, item):
         """Shows preview if item is an image"""
+        self._preview_token += 1
         if item.is_dir:
             self.preview_scroll.hide()
             return
 
-        mime_type, _ = mimetypes.guess_type(str(item.path))
-        if mime_type and mime_type.startswith('image/'):
-            try:
-                pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(
-                    str(item.path), 250, 250, True
-                )
-                self.preview_image.set_from_pixbuf(pixbuf)
-                self.preview_scroll.show()
-            except Exception:
-                self.preview_scroll.hide()
-        else:
+        mime_type = _guess_mime_by_ext(os.path.splitext(item.name)[1].lower())
+        if not (mime_type and mime_type.startswith('image/')):
+            self.preview_scroll.hide()
+            return
+
+        try:
+            key = (item.path_str, item.stat().st_mtime_ns)
+        except OSError:
             self.preview_scroll.hide()
+            return
+
+        # Revisited images reuse their earlier decode
+        pixbuf = self._preview_cache.get(key)
+        if pixbuf is not None:
+            self._preview_cache.move_to_end(key)
+            self.preview_image.set_from_pixbuf(pixbuf)
+            self.preview_scroll.show()
+            return
+
+        # Decode off the main thread so selection stays responsive
+        self.preview_scroll.hide()
+        _IO_POOL.submit(self._decode_preview, self._preview_token, key)
+
+    def _decode_preview(self, token, key):
+        """Decodes and scales an image preview. Runs on _IO_POOL."""
+        if token != self._preview_token:
+            return
+        try:
+            pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(
+                key[0], 250, 250, True
+            )
+        except Exception:
+            pixbuf = None
+        GLib.idle_add(self._apply_preview, token, key, pixbuf)
+
+    def _apply_preview(self, token, key, pixbuf):
+        """Shows a decoded preview unless the selection has changed since"""
+        if token != self._preview_token:
+            return False
+        if pixbuf is None:
+            self.preview_scroll.hide()
+            return False
+        self._preview_cache[key] = pixbuf
+        if len(self._preview_cache) > self.PREVIEW_CACHE_SIZE:
+            self._preview_cache.popitem(last=False)
+        self.preview_image.set_from_pixbuf(pixbuf)
+        self.preview_scroll.show()
+        return False
 
     def clear(self):
         """Clears the preview panel"""
+        self._preview_token += 1
+        self._count_token += 1
         self.icon_image.clear()
         self.name_label.set_text("")
         for child in self.info_grid.get_children():
@@ -403,16 +996,48 @@ class PreviewPanel(Gtk.Box):
 @dataclass
 class SearchResult:
     """Represents a search result"""
+    # Declared by hand, dataclass(slots=True) needs Python 3.10. The
+    # fields have no defaults, so they don't clash with the slots.
+    __slots__ = ('path', 'name', 'is_dir', 'match_type')
+
     path: Path
     name: str
     is_dir: bool
     match_type: str  # "name" or "content"
 
 
+# Worker threads for content search, kept apart from _IO_POOL so a long
+# search doesn't hold up column scans
+_SEARCH_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="miller-search")
+
+# Threads walking subtrees of the search root side by side. They wait on
+# _SEARCH_POOL for content checks, so they can't share it.
+_WALK_POOL = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1),
+                                thread_name_prefix="miller-walk")
+
+# Suffixes searched by content without a MIME lookup
+_TEXT_EXTS = frozenset({
+    '.py', '.txt', '.md', '.json', '.xml', '.js', '.ts', '.html', '.css',
+    '.sh', '.c', '.h', '.cpp', '.rs', '.go', '.java', '.yaml', '.yml',
+    '.toml', '.ini', '.cfg', '.log', '.csv',
+})
+
+# Text-like MIME types for other suffixes
+_TEXT_MIME_TYPES = ('text/', 'application/json', 'application/xml',
+                    'application/javascript', 'application/x-python',
+                    'application/x-sh', 'application/x-perl')
+
+
 class SearchEngine:
     """Handles file searching with name and content matching"""
 
     MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB limit for content search
+    READ_SIZE = 1024 * 1024  # Bytes read at a time for content search
+    MAX_PENDING = 64  # Content checks queued on _SEARCH_POOL at once
+    BATCH_SIZE = 256  # Results handed to the UI per main loop drain
+    DRAIN_INTERVAL = 16  # Milliseconds between drains of found results, about a frame
+    PARALLEL_MIN_DIRS = 4  # Subdirectories of the root needed to walk them in parallel
+    QUEUE_SIZE = 1024  # Results buffered from the parallel walkers
 
     def __init__(self):
         self.cancelled = False
@@ -428,94 +1053,210 @@ class SearchEngine:
         """
         self.cancelled = False
         query_lower = query.lower()
+        if query.isascii():
+            # Content is matched on raw bytes, skipping the decode and the
+            # lowercased copy. Bytes patterns only fold ASCII case.
+            pattern = re.compile(re.escape(query.encode('utf-8')), re.IGNORECASE)
+        else:
+            # Matched on decoded text, so e.g. "perché" finds "PERCHÉ"
+            pattern = re.compile(re.escape(query), re.IGNORECASE)
 
-        for dirpath, dirnames, filenames in os.walk(root_path):
-            if self.cancelled:
-                return
+        # Walk with plain strings, Paths are only built for matches
+        walk = os.walk(os.fspath(root_path))
+        top = next(walk, None)
+        if top is None:
+            return
+        dirpath, dirnames, filenames = top
+        # Skip hidden directories
+        dirnames[:] = [d for d in dirnames if d[:1] != '.']
 
-            # Skip hidden directories
-            dirnames[:] = [d for d in dirnames if not d.startswith('.')]
+        if len(dirnames) < self.PARALLEL_MIN_DIRS:
+            # Too few subtrees to be worth the threads, walk on here
+            yield from self._search_walk(itertools.chain((top,), walk), query_lower, pattern)
+            return
 
-            current_dir = Path(dirpath)
+        # Search the root itself here and walk its subdirectories in parallel
+        yield from self._search_walk((top,), query_lower, pattern)
+        yield from self._search_parallel(
+            [os.path.join(dirpath, d) for d in dirnames], query_lower, pattern
+        )
 
-            # Search in directory names
-            for dirname in dirnames:
+    def _search_walk(self, walk, query_lower: str, pattern: re.Pattern):
+        """Yields the matches among the directories of an os.walk iterator"""
+        # Content checks run on _SEARCH_POOL while the walk goes on, and are
+        # reported in walk order: (future, dirpath, filename)
+        pending = deque()
+        try:
+            for dirpath, dirnames, filenames in walk:
                 if self.cancelled:
                     return
-                if query_lower in dirname.lower():
-                    yield SearchResult(
-                        path=current_dir / dirname,
-                        name=dirname,
-                        is_dir=True,
-                        match_type="name"
+
+                # Skip hidden directories
+                dirnames[:] = [d for d in dirnames if d[:1] != '.']
+
+                # Search in directory names
+                for dirname in dirnames:
+                    if self.cancelled:
+                        return
+                    if query_lower in dirname.lower():
+                        yield SearchResult(
+                            path=Path(dirpath, dirname),
+                            name=dirname,
+                            is_dir=True,
+                            match_type="name"
+                        )
+
+                # Search in file names and contents
+                for filename in filenames:
+                    if self.cancelled:
+                        return
+
+                    # Skip hidden files
+                    if filename[:1] == '.':
+                        continue
+
+                    # Check if name matches
+                    name_match = query_lower in filename.lower()
+                    if name_match:
+                        yield SearchResult(
+                            path=Path(dirpath, filename),
+                            name=filename,
+                            is_dir=False,
+                            match_type="name"
+                        )
+                        continue  # Don't search content if name already matches
+
+                    # Search in file content
+                    if not self._is_text_file(filename):
+                        continue
+                    if len(pending) >= self.MAX_PENDING:
+                        result = self._content_result(*pending.popleft())
+                        if result:
+                            yield result
+                    future = _SEARCH_POOL.submit(
+                        self._search_in_content, os.path.join(dirpath, filename), pattern
                     )
+                    pending.append((future, dirpath, filename))
 
-            # Search in file names and contents
-            for filename in filenames:
+            while pending:
                 if self.cancelled:
                     return
-
-                # Skip hidden files
-                if filename.startswith('.'):
+                result = self._content_result(*pending.popleft())
+                if result:
+                    yield result
+        finally:
+            for future, _, _ in pending:
+                future.cancel()
+
+    def _search_parallel(self, tops, query_lower: str, pattern: re.Pattern):
+        """Yields the matches below the given directories, walking them on
+        _WALK_POOL. Results arrive in no particular order."""
+        results = queue.Queue(maxsize=self.QUEUE_SIZE)
+        futures = [
+            _WALK_POOL.submit(self._walk_subtree, top, query_lower, pattern, results)
+            for top in tops
+        ]
+        remaining = len(futures)  # Walkers yet to put their final None
+        try:
+            while remaining:
+                if self.cancelled:
+                    return
+                try:
+                    result = results.get(timeout=0.1)
+                except queue.Empty:
                     continue
+                if result is None:
+                    remaining -= 1
+                else:
+                    yield result
+        finally:
+            if remaining:
+                # Given up early, stop the walkers too
+                self.cancel()
+                for future in futures:
+                    future.cancel()
+
+    def _walk_subtree(self, top, query_lower, pattern, results):
+        """Puts the matches below top into results, then None.
+        Runs on _WALK_POOL."""
+        try:
+            for result in self._search_walk(os.walk(top), query_lower, pattern):
+                if not self._put_result(results, result):
+                    return
+        finally:
+            self._put_result(results, None)
 
-                file_path = current_dir / filename
+    def _put_result(self, results, result):
+        """Queues a result, waiting for room unless the search is cancelled.
+        Returns False if cancelled."""
+        while not self.cancelled:
+            try:
+                results.put(result, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
 
-                # Check if name matches
-                name_match = query_lower in filename.lower()
-                if name_match:
-                    yield SearchResult(
-                        path=file_path,
-                        name=filename,
-                        is_dir=False,
-                        match_type="name"
-                    )
-                    continue  # Don't search content if name already matches
-
-                # Search in file content
-                if self._search_in_content(file_path, query_lower):
-                    yield SearchResult(
-                        path=file_path,
-                        name=filename,
-                        is_dir=False,
-                        match_type="content"
-                    )
+    def _content_result(self, future, dirpath, filename):
+        """Waits for a content check, returning its SearchResult on a match"""
+        if not future.result():
+            return None
+        return SearchResult(
+            path=Path(dirpath, filename),
+            name=filename,
+            is_dir=False,
+            match_type="content"
+        )
 
-    def _search_in_content(self, file_path: Path, query: str) -> bool:
-        """Searches for query in file content. Returns True if found."""
+    def _is_text_file(self, filename: str) -> bool:
+        """Whether a file is searched by content, judged by its name alone"""
+        ext = os.path.splitext(filename)[1].lower()
+        if ext in _TEXT_EXTS:
+            return True
+        mime_type = _guess_mime_by_ext(ext)
+        return bool(mime_type and mime_type.startswith(_TEXT_MIME_TYPES))
+
+    def _search_in_content(self, file_path: str, pattern: re.Pattern) -> bool:
+        """Searches for query in file content. Returns True if found.
+        Runs on _SEARCH_POOL."""
         try:
             # Check file size
-            if file_path.stat().st_size > self.MAX_FILE_SIZE:
-                return False
-
-            # Check if it's a text file
-            mime_type, _ = mimetypes.guess_type(str(file_path))
-            if not mime_type:
-                return False
-
-            # Only search text-like files
-            text_types = ('text/', 'application/json', 'application/xml',
-                         'application/javascript', 'application/x-python',
-                         'application/x-sh', 'application/x-perl')
-            if not any(mime_type.startswith(t) for t in text_types):
+            if os.stat(file_path).st_size > self.MAX_FILE_SIZE:
                 return False
 
-            # Read and search
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-                return query in content.lower()
+            # Read and search chunk by chunk, carrying over enough of the
+            # previous chunk to catch matches across the boundary. The
+            # escaped pattern is at least as long as the query.
+            overlap = len(pattern.pattern) - 1
+            if isinstance(pattern.pattern, bytes):
+                f = open(file_path, 'rb')
+            else:
+                f = open(file_path, 'r', encoding='utf-8', errors='ignore')
+            empty = pattern.pattern[:0]
+            tail = empty
+            with f:
+                for chunk in iter(lambda: f.read(self.READ_SIZE), empty):
+                    chunk = tail + chunk
+                    if pattern.search(chunk):
+                        return True
+                    tail = chunk[-overlap:] if overlap else empty
+            return False
 
-        except (PermissionError, OSError, UnicodeDecodeError):
+        except (PermissionError, OSError):
             return False
 
 
 class SearchResultsView(Gtk.Box):
     """View for displaying search results"""
 
+    # Store columns
+    COL_ICON = 0
+    COL_MARKUP = 1
+    COL_RESULT = 2
+
     def __init__(self, on_result_activated):
         super().__init__(orientation=Gtk.Orientation.VERTICAL)
         self.on_result_activated = on_result_activated
-        self.icon_theme = Gtk.IconTheme.get_default()
 
         # Header with result count and close button
         header = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
@@ -539,21 +1280,42 @@ class SearchResultsView(Gtk.Box):
         scroll.set_policy(Gtk.PolicyType.AUTOMATIC, Gtk.PolicyType.AUTOMATIC)
         scroll.set_vexpand(True)
 
-        # ListBox for results
-        self.listbox = Gtk.ListBox()
-        self.listbox.set_selection_mode(Gtk.SelectionMode.SINGLE)
-        self.listbox.connect("row-activated", self._on_row_activated)
-        self.listbox.get_style_context().add_class("search-results")
-
-        scroll.add(self.listbox)
+        # TreeView for results: like the columns, rows are drawn by shared
+        # cell renderers instead of a widget tree per hit
+        self.store = Gtk.ListStore(str, str, object)
+        self.treeview = Gtk.TreeView(model=self.store)
+        self.treeview.set_headers_visible(False)
+        self.treeview.set_enable_search(False)
+        # A single click opens a result, as the ListBox did
+        self.treeview.set_activate_on_single_click(True)
+        self.treeview.connect("row-activated", self._on_row_activated)
+        self.treeview.get_style_context().add_class("search-results")
+        self.treeview.get_selection().set_mode(Gtk.SelectionMode.SINGLE)
+
+        column = Gtk.TreeViewColumn()
+        icon_renderer = Gtk.CellRendererPixbuf(stock_size=Gtk.IconSize.LARGE_TOOLBAR,
+                                               xpad=12, ypad=6)
+        column.pack_start(icon_renderer, False)
+        column.add_attribute(icon_renderer, "icon-name", self.COL_ICON)
+
+        # Name, match type and parent directory
+        text_renderer = Gtk.CellRendererText(ellipsize=Pango.EllipsizeMode.MIDDLE, ypad=6)
+        column.pack_start(text_renderer, True)
+        column.add_attribute(text_renderer, "markup", self.COL_MARKUP)
+
+        arrow_renderer = Gtk.CellRendererPixbuf(icon_name="go-next-symbolic",
+                                                sensitive=False, xpad=12)
+        column.pack_end(arrow_renderer, False)
+        self.treeview.append_column(column)
+
+        scroll.add(self.treeview)
         self.pack_start(scroll, True, True, 0)
 
         self.result_count = 0
 
     def clear(self):
         """Clears all results"""
-        for child in self.listbox.get_children():
-            self.listbox.remove(child)
+        self.store.clear()
         self.result_count = 0
         self.status_label.set_text("Searching...")
 
@@ -570,82 +1332,29 @@ class SearchResultsView(Gtk.Box):
         else:
             self.status_label.set_text(f"{self.result_count} results")
 
-    def add_result(self, result: SearchResult):
-        """Adds a search result to the list"""
-        self.result_count += 1
-
-        row = Gtk.ListBoxRow()
-        row.result = result
-
-        hbox = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
-        hbox.set_margin_start(12)
-        hbox.set_margin_end(12)
-        hbox.set_margin_top(6)
-        hbox.set_margin_bottom(6)
-
-        # Icon
-        if result.is_dir:
-            icon_name = "folder"
-        else:
-            mime_type, _ = mimetypes.guess_type(str(result.path))
-            if mime_type:
-                icon_name = mime_type.replace('/', '-')
-                if not self.icon_theme.has_icon(icon_name):
-                    icon_name = "text-x-generic"
-            else:
-                icon_name = "text-x-generic"
-
-        try:
-            icon = self.icon_theme.load_icon(icon_name, 24, Gtk.IconLookupFlags.FORCE_SIZE)
-            image = Gtk.Image.new_from_pixbuf(icon)
-        except Exception:
-            image = Gtk.Image.new_from_icon_name("text-x-generic", Gtk.IconSize.LARGE_TOOLBAR)
-        hbox.pack_start(image, False, False, 0)
-
-        # Text container
-        text_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=2)
-
-        # File name with match type indicator
-        name_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-        name_label = Gtk.Label(label=result.name)
-        name_label.set_xalign(0)
-        name_label.set_ellipsize(Pango.EllipsizeMode.END)
-        name_box.pack_start(name_label, False, False, 0)
-
-        # Match type badge
-        if result.match_type == "content":
-            badge = Gtk.Label(label="content")
-            badge.get_style_context().add_class("dim-label")
-            badge.set_markup("<small><i>in content</i></small>")
-            name_box.pack_start(badge, False, False, 0)
-
-        text_box.pack_start(name_box, False, False, 0)
-
-        # Path
-        path_label = Gtk.Label(label=str(result.path.parent))
-        path_label.set_xalign(0)
-        path_label.set_ellipsize(Pango.EllipsizeMode.MIDDLE)
-        path_label.get_style_context().add_class("dim-label")
-        text_box.pack_start(path_label, False, False, 0)
-
-        hbox.pack_start(text_box, True, True, 0)
-
-        # Arrow
-        arrow = Gtk.Image.new_from_icon_name("go-next-symbolic", Gtk.IconSize.MENU)
-        arrow.set_opacity(0.5)
-        hbox.pack_end(arrow, False, False, 0)
-
-        row.add(hbox)
-        self.listbox.add(row)
-        row.show_all()
+    def add_results(self, results):
+        """Adds a batch of search results to the list"""
+        append = self.store.append
+        for result in results:
+            append(self._row_values(result))
+        self.result_count += len(results)
 
         # Update status
         self.status_label.set_text(f"{self.result_count} results...")
+        return False
 
-    def _on_row_activated(self, listbox, row):
+    def _row_values(self, result: SearchResult):
+        """Returns the store row for a search result"""
+        markup = GLib.markup_escape_text(result.name)
+        # Match type badge, only shown for content matches
+        if result.match_type == "content":
+            markup += ' <span alpha="55%"><small><i>in content</i></small></span>'
+        markup += f'\n<span alpha="55%">{GLib.markup_escape_text(str(result.path.parent))}</span>'
+        return (_icon_name_for(result.name, result.is_dir), markup, result)
+
+    def _on_row_activated(self, treeview, tree_path, column):
         """Handles result activation"""
-        if row and hasattr(row, 'result'):
-            self.on_result_activated(row.result)
+        self.on_result_activated(self.store[tree_path][self.COL_RESULT])
 
 
 class MillerColumnsContainer(Gtk.Box):
@@ -660,6 +1369,12 @@ class MillerColumnsContainer(Gtk.Box):
         self.handles = []  # List of ResizeHandle
         self.column_widths = []  # Column widths (-1 = auto)
 
+        self._distribute_source_id = 0  # Pending _distribute_widths idle
+        self._drag_source_id = 0  # Pending throttled drag update
+        self._drag_deltas = {}  # ResizeHandle -> accumulated drag delta
+        self._select_source_id = 0  # Pending debounced selection
+        self._pending_selection = None  # (column, item) waiting for it
+
         self.get_style_context().add_class("miller-columns-container")
 
     def add_column(self, path):
@@ -681,7 +1396,7 @@ class MillerColumnsContainer(Gtk.Box):
         column.show_all()
 
         # Recalculate widths
-        GLib.idle_add(self._distribute_widths)
+        self._schedule_distribute()
 
         return column
 
@@ -695,6 +1410,7 @@ class MillerColumnsContainer(Gtk.Box):
         # Remove columns and handles
         while len(self.columns) > idx + 1:
             col = self.columns.pop()
+            col.cancel_populate()
             self.remove(col)
             col.destroy()
             self.column_widths.pop()
@@ -705,11 +1421,12 @@ class MillerColumnsContainer(Gtk.Box):
                 handle.destroy()
 
         # Recalculate widths
-        GLib.idle_add(self._distribute_widths)
+        self._schedule_distribute()
 
     def clear(self):
         """Removes all columns"""
         for col in self.columns:
+            col.cancel_populate()
             self.remove(col)
             col.destroy()
         for handle in self.handles:
@@ -720,12 +1437,32 @@ class MillerColumnsContainer(Gtk.Box):
         self.column_widths.clear()
 
     def _on_item_selected(self, column, item):
-        """Handles selection and recalculates widths"""
-        self.on_item_selected_callback(column, item)
-        GLib.idle_add(self._distribute_widths)
+        """Handles selection, debounced so quickly moving through a column
+        doesn't open a column for every row passed over"""
+        self._pending_selection = (column, item)
+        if self._select_source_id:
+            GLib.source_remove(self._select_source_id)
+        self._select_source_id = GLib.timeout_add(30, self._flush_selection)
+
+    def _flush_selection(self):
+        """Reports the last selection and recalculates widths"""
+        self._select_source_id = 0
+        column, item = self._pending_selection
+        self._pending_selection = None
+        # The column may have been removed while the selection was pending
+        if column in self.columns:
+            self.on_item_selected_callback(column, item)
+            self._schedule_distribute()
+        return False
+
+    def _schedule_distribute(self):
+        """Queues a width redistribution, coalescing repeated requests"""
+        if not self._distribute_source_id:
+            self._distribute_source_id = GLib.idle_add(self._distribute_widths)
 
     def _distribute_widths(self):
         """Distributes widths equally among columns"""
+        self._distribute_source_id = 0
         if not self.columns:
             return False
 
@@ -758,7 +1495,21 @@ class MillerColumnsContainer(Gtk.Box):
         return False
 
     def _on_handle_drag(self, handle, delta):
-        """Handles dragging of a resize handle"""
+        """Handles dragging of a resize handle, applied at most every 16ms"""
+        self._drag_deltas[handle] = self._drag_deltas.get(handle, 0) + delta
+        if not self._drag_source_id:
+            self._drag_source_id = GLib.timeout_add(16, self._flush_handle_drag)
+
+    def _flush_handle_drag(self):
+        """Applies the drag motion accumulated since the last frame"""
+        self._drag_source_id = 0
+        deltas, self._drag_deltas = self._drag_deltas, {}
+        for handle, delta in deltas.items():
+            self._apply_handle_drag(handle, delta)
+        return False
+
+    def _apply_handle_drag(self, handle, delta):
+        """Resizes the two columns on either side of a handle"""
         idx = handle.column_index
 
         if idx >= len(self.columns) - 1:
@@ -803,12 +1554,19 @@ class MillerColumnsWindow(Gtk.ApplicationWindow):
 
         self.set_default_size(1200, 700)
         self.current_path = Path(start_path or Path.home())
+        # Bumped per navigation so a superseded background resolve is dropped
+        self._navigate_generation = 0
 
         # Search state
         self.search_mode = False
         self.search_engine = SearchEngine()
         self.search_thread = None
-        self.search_timeout_id = None
+        # Bumped per search so results of a superseded one are dropped
+        self._search_generation = 0
+        self.search_timeout_id = None  # Debounce timer, alive while typing
+        self._pending_query = None  # Query waiting for typing to pause
+        self._last_typed = 0.0  # time.monotonic() of the last search edit
+        self._last_query = None  # Query of the running or last search
 
         self._setup_css()
 
@@ -857,77 +1615,34 @@ class MillerColumnsWindow(Gtk.ApplicationWindow):
         # Navigate to initial path
         self._navigate_to(self.current_path)
 
+        # Shortcut handlers by (Ctrl state, keyval)
+        self._key_table = {
+            (Gdk.ModifierType.CONTROL_MASK, Gdk.KEY_f): self._focus_search,
+            (0, Gdk.KEY_Escape): self._handle_escape,
+            (0, Gdk.KEY_BackSpace): self._handle_backspace,
+        }
         self.connect("key-press-event", self._on_key_press)
+        self.connect("destroy", self._on_destroy)
         self.show_all()
 
+    def _on_destroy(self, widget):
+        """Stops a running search, whose pool threads would otherwise keep
+        the process alive after the window is gone"""
+        self.search_engine.cancel()
+        self._search_generation += 1
+
     def _setup_css(self):
         """Sets up custom CSS styles"""
-        css = b"""
-        .miller-columns-container {
-            background-color: @theme_base_color;
-        }
-
-        .miller-column {
-            background-color: @theme_base_color;
-        }
-
-        .miller-column row {
-            padding: 2px;
-        }
-
-        .miller-column row:selected {
-            background-color: @theme_selected_bg_color;
-            color: @theme_selected_fg_color;
-        }
-
-        .preview-frame {
-            background-color: @theme_base_color;
-        }
-
-        .preview-title {
-            font-size: 14px;
-        }
-
-        .path-bar {
-            padding: 4px 8px;
-            background-color: @theme_bg_color;
-        }
-
-        .path-button {
-            padding: 2px 6px;
-            min-height: 24px;
-        }
-
-        .resize-handle {
-            background-color: @borders;
-            min-width: 6px;
-        }
-
-        .resize-handle:hover {
-            background-color: @theme_selected_bg_color;
-        }
-
-        .search-results {
-            background-color: @theme_base_color;
-        }
-
-        .search-results row {
-            padding: 4px;
-        }
-
-        .search-results row:selected {
-            background-color: @theme_selected_bg_color;
-            color: @theme_selected_fg_color;
-        }
-        """
-
-        style_provider = Gtk.CssProvider()
-        style_provider.load_from_data(css)
+        global _css_installed
+        # The provider applies to the whole screen, so later windows reuse it
+        if _css_installed:
+            return
         Gtk.StyleContext.add_provider_for_screen(
             Gdk.Screen.get_default(),
-            style_provider,
+            _CSS_PROVIDER,
             Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
         )
+        _css_installed = True
 
     def _create_toolbar(self, container):
         """Creates the navigation toolbar"""
@@ -952,6 +1667,8 @@ class MillerColumnsWindow(Gtk.ApplicationWindow):
         # Path bar
         self.path_bar = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=2)
         self.path_bar.get_style_context().add_class("path-bar")
+        self._path_bar_parts = ()  # Path parts currently shown
+        self._path_bar_widgets = []  # [separator,] button per part
 
         path_scroll = Gtk.ScrolledWindow()
         path_scroll.set_policy(Gtk.PolicyType.AUTOMATIC, Gtk.PolicyType.NEVER)
@@ -981,53 +1698,110 @@ class MillerColumnsWindow(Gtk.ApplicationWindow):
         container.pack_start(toolbar_box, False, False, 0)
 
     def _update_path_bar(self):
-        """Updates the path bar"""
-        for child in self.path_bar.get_children():
-            self.path_bar.remove(child)
-
+        """Updates the path bar, touching only the parts that changed"""
         parts = self.current_path.parts
-        for i, part in enumerate(parts):
+        old_parts = self._path_bar_parts
+        widgets = self._path_bar_widgets
+
+        # Keep the buttons of the common prefix
+        common = 0
+        while (common < len(parts) and common < len(old_parts)
+               and parts[common] == old_parts[common]):
+            common += 1
+
+        # Drop the buttons past the new depth
+        for old in widgets[len(parts):]:
+            for widget in old:
+                widget.destroy()
+        del widgets[len(parts):]
+
+        # Relabel the buttons that diverge from the old path in place. A
+        # button only knows its depth, its target is read from the parts
+        # when clicked.
+        for i in range(common, len(widgets)):
+            widgets[i][-1].set_label(parts[i] or "/")
+
+        # Add buttons for the new, deeper parts
+        for i in range(len(widgets), len(parts)):
+            new = []
             if i > 0:
                 sep = Gtk.Label(label="/")
                 sep.set_opacity(0.5)
                 self.path_bar.pack_start(sep, False, False, 0)
+                new.append(sep)
 
-            btn = Gtk.Button(label=part or "/")
+            btn = Gtk.Button(label=parts[i] or "/")
             btn.get_style_context().add_class("path-button")
             btn.get_style_context().add_class("flat")
-            btn.path = Path(*parts[:i+1])
-            btn.connect("clicked", self._on_path_button_clicked)
+            btn.connect("clicked", self._on_path_button_clicked, i)
             self.path_bar.pack_start(btn, False, False, 0)
+            new.append(btn)
+            for widget in new:
+                widget.show()
+            widgets.append(new)
 
-        self.path_bar.show_all()
+        self._path_bar_parts = parts
 
     def _navigate_to(self, path):
-        """Navigates to a specific path"""
-        path = Path(path).resolve()
+        """Navigates to a specific path, once it's been resolved in the background"""
+        self._navigate_generation += 1
+        generation = self._navigate_generation
+        future = _IO_POOL.submit(self._resolve_path, path)
+        future.add_done_callback(
+            lambda f: GLib.idle_add(self._apply_navigation, generation, f)
+        )
 
-        if not path.exists():
-            return
+    @staticmethod
+    def _resolve_path(path):
+        """Returns the canonical path and its stat result. Runs on _IO_POOL."""
+        path = Path(path).resolve()
+        # One stat answers both whether the path exists and whether it's a folder
+        return path, os.stat(path)
 
-        self.columns_container.clear()
+    def _apply_navigation(self, generation, future):
+        """Rebuilds the columns for a resolved path unless it's been superseded"""
+        if generation != self._navigate_generation:
+            return False
+        try:
+            path, st = future.result()
+        except OSError:
+            return False
 
+        # Every ancestor of an existing path is a directory, so only the
+        # last component needs a check
         parts = path.parts
+        if not stat.S_ISDIR(st.st_mode):
+            parts = parts[:-1]
         current = Path(parts[0])
 
-        self.columns_container.add_column(current)
+        # The child property notifications of packing every column are
+        # held back and emitted together once the columns are in place
+        container = self.columns_container
+        container.freeze_child_notify()
+        try:
+            container.clear()
+            container.add_column(current)
 
-        for part in parts[1:]:
-            next_path = current / part
-            if next_path.is_dir():
-                if self.columns_container.columns:
-                    self.columns_container.columns[-1].select_path(next_path)
-                self.columns_container.add_column(next_path)
+            for part in parts[1:]:
+                next_path = current / part
+                container.columns[-1].select_path(next_path)
+                container.add_column(next_path)
                 current = next_path
+        finally:
+            container.thaw_child_notify()
+
+        # The selections above aren't reported, so the preview would still
+        # show an item from before the navigation
+        self.preview_panel.clear()
 
         self.current_path = path
         self._update_path_bar()
+        return False
 
     def _on_item_selected(self, column, item):
         """Handles item selection"""
+        # A selection made meanwhile wins over a navigation still resolving
+        self._navigate_generation += 1
         self.columns_container.remove_columns_after(column)
 
         if item.is_dir:
@@ -1042,18 +1816,38 @@ class MillerColumnsWindow(Gtk.ApplicationWindow):
     def _on_item_activated(self, item):
         """Handles item activation (double-click)"""
         if not item.is_dir:
-            try:
-                subprocess.Popen(['xdg-open', str(item.path)])
-            except Exception as e:
-                dialog = Gtk.MessageDialog(
-                    transient_for=self,
-                    flags=0,
-                    message_type=Gtk.MessageType.ERROR,
-                    buttons=Gtk.ButtonsType.OK,
-                    text=f"Cannot open file: {e}"
-                )
-                dialog.run()
-                dialog.destroy()
+            self._open_file(item.path, show_error=True)
+
+    def _open_file(self, path, show_error=False):
+        """Opens a file in its default application without blocking.
+        GLib picks the handler from its MIME database, no xdg-open script."""
+        Gio.AppInfo.launch_default_for_uri_async(
+            path.as_uri(), None, None, self._on_file_opened, show_error
+        )
+
+    def _on_file_opened(self, source, result, show_error):
+        """Reports a file that couldn't be opened"""
+        try:
+            Gio.AppInfo.launch_default_for_uri_finish(result)
+        except GLib.Error as e:
+            if show_error:
+                self._show_error(f"Cannot open file: {e.message}")
+            else:
+                print(f"Error opening file: {e.message}")
+
+    def _show_error(self, text):
+        """Shows an error dialog and returns at once. Unlike
+        MessageDialog.run(), no nested main loop holds up idle callbacks
+        while it's open."""
+        dialog = Gtk.MessageDialog(
+            transient_for=self,
+            modal=True,
+            message_type=Gtk.MessageType.ERROR,
+            buttons=Gtk.ButtonsType.OK,
+            text=text
+        )
+        dialog.connect("response", lambda dialog, response: dialog.destroy())
+        dialog.show()
 
     def _on_go_back(self, button):
         """Goes to parent directory"""
@@ -1064,37 +1858,35 @@ class MillerColumnsWindow(Gtk.ApplicationWindow):
         """Goes to home directory"""
         self._navigate_to(Path.home())
 
-    def _on_path_button_clicked(self, button):
+    def _on_path_button_clicked(self, button, depth):
         """Handles path button click"""
-        self._navigate_to(button.path)
+        self._navigate_to(Path(*self._path_bar_parts[:depth + 1]))
 
     def _on_open_in_nemo(self, button):
         """Opens current folder in Nemo"""
+        nemo = _find_program('nemo')
+        if nemo is None:
+            print("Error opening Nemo: nemo not found")
+            return
         try:
-            subprocess.Popen(['nemo', str(self.current_path)])
+            _spawn([nemo, str(self.current_path)])
         except Exception as e:
             print(f"Error opening Nemo: {e}")
 
     def _on_open_terminal(self, button):
         """Opens a terminal in the current folder"""
+        # Found once, instead of trying to launch every candidate on each click
+        term = _find_terminal()
+        if term is None:
+            print("Error opening terminal: no terminal emulator found")
+            return
         try:
-            terminals = ['gnome-terminal', 'xfce4-terminal', 'konsole', 'xterm']
-            for term in terminals:
-                try:
-                    subprocess.Popen([term, '--working-directory', str(self.current_path)])
-                    return
-                except FileNotFoundError:
-                    continue
+            _spawn([term, '--working-directory', str(self.current_path)])
         except Exception as e:
             print(f"Error opening terminal: {e}")
 
     def _on_search_changed(self, search_entry):
         """Handles search text changes with debounce"""
-        # Cancel any pending search timeout
-        if self.search_timeout_id:
-            GLib.source_remove(self.search_timeout_id)
-            self.search_timeout_id = None
-
         query = search_entry.get_text().strip()
 
         if not query:
@@ -1102,8 +1894,23 @@ class MillerColumnsWindow(Gtk.ApplicationWindow):
             self._exit_search_mode()
             return
 
-        # Debounce: wait 300ms before starting search
-        self.search_timeout_id = GLib.timeout_add(300, self._start_search, query)
+        # Debounce: start the search once typing pauses for 300ms. One timer
+        # polls for the pause instead of being replaced on every keystroke.
+        self._pending_query = query
+        self._last_typed = time.monotonic()
+        if not self.search_timeout_id:
+            self.search_timeout_id = GLib.timeout_add(50, self._check_search_idle)
+
+    def _check_search_idle(self):
+        """Starts the pending search once typing has paused"""
+        if time.monotonic() - self._last_typed < 0.3:
+            return True
+        self.search_timeout_id = None
+        query, self._pending_query = self._pending_query, None
+        # Edits that end on the query already searched need no new search
+        if query != self._last_query or not self.search_mode:
+            self._start_search(query)
+        return False
 
     def _on_search_stopped(self, search_entry):
         """Handles search stop (Escape in search entry)"""
@@ -1111,50 +1918,99 @@ class MillerColumnsWindow(Gtk.ApplicationWindow):
 
     def _start_search(self, query):
         """Starts the actual search in a background thread"""
-        self.search_timeout_id = None
+        self._last_query = query
 
-        # Cancel any running search
+        # Cancel any running search. It's left to wind down on its own:
+        # the generation check drops anything it still reports.
         if self.search_thread and self.search_thread.is_alive():
             self.search_engine.cancel()
-            self.search_thread.join(timeout=0.5)
+        self._search_generation += 1
+        # A fresh engine, so starting this search doesn't clear the old
+        # one's cancel flag
+        self.search_engine = SearchEngine()
 
         # Enter search mode
         self.search_mode = True
         self.content_stack.set_visible_child_name("search")
         self.search_results_view.start_search()
 
-        # Start new search thread
+        # Start new search thread. It queues results as they're found, and
+        # the main loop shows them every frame, so no match waits on the next.
+        results = queue.SimpleQueue()
         self.search_thread = threading.Thread(
             target=self._search_thread_func,
-            args=(self.current_path, query),
+            args=(self.search_engine, self._search_generation, self.current_path,
+                  query, results),
             daemon=True
         )
         self.search_thread.start()
+        GLib.timeout_add(SearchEngine.DRAIN_INTERVAL, self._drain_search_results,
+                         self._search_generation, results)
 
-        return False  # Don't repeat timeout
-
-    def _search_thread_func(self, root_path, query):
+    def _search_thread_func(self, engine, generation, root_path, query, results):
         """Search function running in background thread"""
         try:
-            for result in self.search_engine.search(root_path, query):
-                if self.search_engine.cancelled:
+            for result in engine.search(root_path, query):
+                if engine.cancelled or generation != self._search_generation:
                     break
-                # Add result to UI via main thread
-                GLib.idle_add(self.search_results_view.add_result, result)
+                results.put(result)
         finally:
             # Signal search complete
-            GLib.idle_add(self.search_results_view.stop_search)
+            results.put(None)
+
+    def _drain_search_results(self, generation, results):
+        """Shows the results found since the last call, until the search
+        completes or is superseded"""
+        if generation != self._search_generation:
+            return False
+
+        batch = []
+        done = False
+        try:
+            while len(batch) < SearchEngine.BATCH_SIZE:
+                result = results.get_nowait()
+                if result is None:
+                    done = True
+                    break
+                batch.append(result)
+        except queue.Empty:
+            pass
+
+        if batch:
+            self.search_results_view.add_results(batch)
+        if done:
+            self.search_results_view.stop_search()
+            return False
+        return True
 
     def _exit_search_mode(self):
         """Exits search mode and returns to columns view"""
+        # Cancel any pending search timeout
+        if self.search_timeout_id:
+            GLib.source_remove(self.search_timeout_id)
+            self.search_timeout_id = None
+        self._pending_query = None
+
+        # Cleared without coming back here through search-changed
+        if self.search_entry.get_text():
+            self.search_entry.handler_block_by_func(self._on_search_changed)
+            try:
+                self.search_entry.set_text("")
+            finally:
+                self.search_entry.handler_unblock_by_func(self._on_search_changed)
+
+        if not self.search_mode:
+            return
+
         # Cancel any running search
         if self.search_thread and self.search_thread.is_alive():
             self.search_engine.cancel()
+        self._search_generation += 1
 
         self.search_mode = False
         self.content_stack.set_visible_child_name("columns")
-        self.search_entry.set_text("")
-        self.search_results_view.clear()
+        if self.search_results_view.result_count:
+            self.search_results_view.clear()
 
     def _on_search_result_activated(self, result: SearchResult):
         """Handles activation of a search result"""
@@ -1170,36 +2026,46 @@ class MillerColumnsWindow(Gtk.ApplicationWindow):
 
         # If it's a file, open it
         if not result.is_dir:
-            try:
-                subprocess.Popen(['xdg-open', str(result.path)])
-            except Exception as e:
-                print(f"Error opening file: {e}")
+            self._open_file(result.path)
 
     def _on_key_press(self, widget, event):
         """Handles keyboard shortcuts"""
-        # Ctrl+F: Focus search entry
-        if event.state & Gdk.ModifierType.CONTROL_MASK:
-            if event.keyval == Gdk.KEY_f:
-                self.search_entry.grab_focus()
-                return True
+        handler = self._key_table.get(
+            (event.state & Gdk.ModifierType.CONTROL_MASK, event.keyval)
+        )
+        return handler() if handler else False
 
-        # Escape: Exit search mode or close window
-        if event.keyval == Gdk.KEY_Escape:
-            if self.search_mode:
-                self._exit_search_mode()
-                return True
-            else:
-                self.close()
-                return True
+    def _focus_search(self):
+        """Ctrl+F: Focus search entry"""
+        self.search_entry.grab_focus()
+        return True
 
-        # Backspace: Go back (only if not in search entry)
-        if event.keyval == Gdk.KEY_BackSpace:
-            # Don't intercept if focus is on search entry
-            if not self.search_entry.has_focus():
-                self._on_go_back(None)
-                return True
+    def _handle_escape(self):
+        """Escape: Exit search mode or close window"""
+        if self.search_mode:
+            self._exit_search_mode()
+        else:
+            self.close()
+        return True
+
+    def _handle_backspace(self):
+        """Backspace: Go back (only if not in search entry)"""
+        # Don't intercept if focus is on search entry
+        if self.search_entry.has_focus():
+            return False
+        self._on_go_back(None)
+        return True
 
-        return False
+
+def _uri_to_path(arg):
+    """Returns the path of a command line argument, which may be a file:// URI"""
+    if not arg.startswith('file://'):
+        return arg
+    try:
+        # Also handles the file://host/path form
+        return GLib.filename_from_uri(arg)[0]
+    except GLib.Error:
+        return urllib.parse.unquote(arg[7:])
 
 
 class MillerColumnsApp(Gtk.Application):
@@ -1212,6 +2078,13 @@ class MillerColumnsApp(Gtk.Application):
         )
         self.start_path = start_path
 
+    def do_startup(self):
+        """Sets up the application, looking up helper programs in the background"""
+        Gtk.Application.do_startup(self)
+        # Warms the lookup caches, so the first click doesn't walk PATH
+        _IO_POOL.submit(_find_program, 'nemo')
+        _IO_POOL.submit(_find_terminal)
+
     def do_activate(self):
         """Activates the application"""
         win = MillerColumnsWindow(self, self.start_path)
@@ -1222,11 +2095,7 @@ class MillerColumnsApp(Gtk.Application):
         args = command_line.get_arguments()
 
         if len(args) > 1:
-            path = args[1]
-            # Handle file:// URI
-            if path.startswith('file://'):
-                path = urllib.parse.unquote(path[7:])
-            self.start_path = path
+            self.start_path = _uri_to_path(args[1])
 
         self.activate()
         return 0
@@ -1237,11 +2106,7 @@ def main():
     start_path = None
 
     if len(sys.argv) > 1:
-        path = sys.argv[1]
-        # Handle file:// URI
-        if path.startswith('file://'):
-            path = urllib.parse.unquote(path[7:])
-        start_path = path
+        start_path = _uri_to_path(sys.argv[1])
 
     app = MillerColumnsApp(start_path)
     return app.run(sys.argv)